@@ -0,0 +1,105 @@
+import gzip
+import os
+import re
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gantt_artifacts
+from gantt_artifacts import brotli, write_artifacts, write_batch
+from gantt_html import PAGE_STYLE, minify_css
+
+# ===== BENCHMARK: COMPRESSED ARTIFACTS AND MULTI-THREADED BATCH WRITES =====
+N_REPORTS = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+TASKS_PER_REPORT = 5000
+WORKER_COUNTS = [1, 2, 4, os.cpu_count() or 1]
+FORMATS = ("html", "gz", "br") if brotli else ("html", "gz")  # brotli is optional
+LEVEL = {"gz": 9, "br": 9}
+
+
+def make_figure(seed):
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 365, TASKS_PER_REPORT), unit="D")
+    return go.Figure(go.Bar(
+        y=[f"Task {i}" for i in range(TASKS_PER_REPORT)], base=start,
+        x=rng.integers(1, 30, TASKS_PER_REPORT) * 86400000, orientation="h",
+        hovertext=[f"Task {i} / seed {seed}" for i in range(TASKS_PER_REPORT)]
+    )).update_layout(height=800, width=1400)
+
+
+def self_check(tmp, fig):
+    """Round-trip the compressed artifacts, check minify_css() and failure cleanup."""
+    path = os.path.join(tmp, "check.html")
+    artifacts = write_artifacts(path, fig, formats=FORMATS, minify=True)
+    with open(path, 'rb') as f:
+        plain = f.read()
+    with gzip.open(path + ".gz", 'rb') as f:
+        assert f.read() == plain, ".html.gz does not decompress to the plain .html"
+    if "br" in FORMATS:
+        with open(path + ".br", 'rb') as f:
+            assert brotli.decompress(f.read()) == plain, ".html.br does not decompress to the plain .html"
+
+    style = re.search(r"<style>(.*?)</style>", PAGE_STYLE, flags=re.S)[1]
+    minified = minify_css(style)
+    assert "/*" not in minified and "\n" not in minified
+    assert minified.count("{") == style.count("{") and minified.count("}") == style.count("}")
+    assert minify_css(minified) == minified, "minify_css() is not idempotent"
+    assert minified.encode() in plain, "minified <style> block missing from the written page"
+
+    def failing_rows():
+        yield "<tr></tr>"
+        raise RuntimeError("row generator failed")
+    try:
+        write_artifacts(path, fig, [("T", "", ("A",), failing_rows())], formats=FORMATS)
+    except RuntimeError:
+        pass
+    assert sorted(os.listdir(tmp)) == sorted(os.path.basename(a.path) for a in artifacts), os.listdir(tmp)
+    with open(path, 'rb') as f:
+        assert f.read() == plain, "a failed write replaced an existing artifact"
+
+    # Flushing .gz fails after .html has already closed cleanly: nothing may be replaced
+    finish = gantt_artifacts._TimedSink.finish
+    def failing_finish(sink):
+        if sink.path.endswith(".gz"):
+            raise OSError("simulated ENOSPC while flushing")
+        finish(sink)
+    gantt_artifacts._TimedSink.finish = failing_finish
+    try:
+        write_artifacts(path, fig, [("T", "", ("A",), ["<tr></tr>"])], formats=FORMATS)
+    except OSError:
+        pass
+    finally:
+        gantt_artifacts._TimedSink.finish = finish
+    assert sorted(os.listdir(tmp)) == sorted(os.path.basename(a.path) for a in artifacts), os.listdir(tmp)
+    with open(path, 'rb') as f:
+        assert f.read() == plain, "a failed close replaced the .html next to the old compressed copies"
+
+    print(f"Self-check passed: compressed round-trip, CSS {len(style) / 1024:.1f} KB -> "
+          f"{len(minified) / 1024:.1f} KB, failed writes and closes leave no partial or mixed files")
+    for artifact in artifacts:
+        print(f"  {os.path.basename(artifact.path):<18} {artifact.size / 1024:8.1f} KB  "
+              f"{artifact.seconds * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    figs = [make_figure(seed) for seed in range(N_REPORTS)]
+    print(f"Reports: {N_REPORTS} x {TASKS_PER_REPORT} tasks, formats {FORMATS}, levels {LEVEL}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        self_check(tmp, figs[0])
+
+    baseline = None
+    for workers in sorted(set(WORKER_COUNTS)):
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs = [(os.path.join(tmp, f"report_{i}.html"), fig, [], {}) for i, fig in enumerate(figs)]
+            start = time.perf_counter()
+            batch = write_batch(jobs, workers, formats=FORMATS, level=LEVEL)
+            seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(f"{workers:>3} thread(s): {seconds:.2f}s  ({baseline / seconds:.2f}x, {len(batch)} reports)")
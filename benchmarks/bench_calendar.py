@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gantt_calendar import get_calendar, working_days, shift_end, team_working_days
+
+# ===== BENCHMARK: VECTORIZED WORKING DAYS VS PER-ROW LOOP =====
+N_TASKS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+calendars = {
+    "default": {"weekmask": "Mon Tue Wed Thu Fri", "holidays": ["2025-01-01", "2025-12-25", "2025-12-26"]},
+    "ops": {"weekmask": "Mon Tue Wed Thu Fri Sat", "holidays": ["2025-12-25"]},
+    "emea": {"weekmask": "Mon Tue Wed Thu Fri", "holidays": ["2025-01-01", "2025-04-18", "2025-04-21"]},
+}
+
+
+def make_tasks(n):
+    rng = np.random.default_rng(0)
+    start = np.datetime64("2025-01-01") + rng.integers(0, 365, n).astype("timedelta64[D]")
+    return pd.DataFrame({
+        "Start": pd.to_datetime(start),
+        "End": pd.to_datetime(start + rng.integers(0, 60, n).astype("timedelta64[D]")),
+        "Team": rng.choice(list(calendars), n),
+    })
+
+
+def loop_working_days(df):
+    # What a straightforward per-row implementation looks like
+    weekdays = {team: {day[:3] for day in spec["weekmask"].split()} for team, spec in calendars.items()}
+    holidays = {team: set(pd.to_datetime(spec["holidays"]).date) for team, spec in calendars.items()}
+    one_day = timedelta(days=1)
+    days = []
+    for row in df.itertuples(index=False):
+        team = row.Team if row.Team in calendars else "default"
+        day, end, count = row.Start.date(), row.End.date(), 0
+        while day <= end:
+            if day.strftime("%a") in weekdays[team] and day not in holidays[team]:
+                count += 1
+            day += one_day
+        days.append(count)
+    return np.array(days)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    df = make_tasks(N_TASKS)
+    print(f"Tasks: {N_TASKS}")
+
+    vectorized, vector_seconds = timed(team_working_days, df, calendars)
+    print(f"Vectorized (team calendars): {vector_seconds:.3f}s")
+
+    cached, cached_seconds = timed(team_working_days, df, calendars)
+    print(f"Vectorized, calendars cached: {cached_seconds:.3f}s")
+
+    default = get_calendar(**calendars["default"])
+    _, shift_seconds = timed(shift_end, df["Start"], vectorized, default)
+    print(f"Vectorized shift_end():       {shift_seconds:.3f}s")
+
+    looped, loop_seconds = timed(loop_working_days, df)
+    print(f"Per-row Python loop:          {loop_seconds:.3f}s")
+    print(f"Speedup:                      {loop_seconds / cached_seconds:.0f}x")
+
+    assert np.array_equal(looped, vectorized.to_numpy())
+    assert np.array_equal(working_days(df["Start"], df["End"], default)[:10],
+                          team_working_days(df.assign(Team="default"), calendars)[:10].to_numpy())
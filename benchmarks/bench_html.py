@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gantt_html import TASK_COLUMNS, PAGE_STYLE, page_head, page_header, task_rows, write_report
+
+# ===== BENCHMARK: str.replace() PAGE ASSEMBLY VS STREAMED CHUNKS =====
+N_TASKS = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+phase_colors = {"Planning": "#FF6B6B", "Design": "#4ECDC4", "Development": "#45B7D1", "Testing": "#96CEB4"}
+
+
+def make_report(n):
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 365, n), unit="D")
+    df = pd.DataFrame({
+        "Task": [f"Task {i}" for i in range(n)],
+        "Phase": rng.choice(list(phase_colors), n),
+        "Start": start,
+        "End": start + pd.to_timedelta(rng.integers(1, 30, n), unit="D"),
+        "Progress": rng.integers(0, 101, n),
+    })
+    df["Duration"] = (df["End"] - df["Start"]).dt.days + 1
+    df["Working_Days"] = df["Duration"]
+    df["Working_End"] = df["End"]
+    fig = go.Figure(go.Bar(
+        y=df["Task"], base=df["Start"], x=(df["End"] - df["Start"]).dt.total_seconds() * 1000,
+        orientation="h", hovertext=df["Task"] + " / " + df["Phase"]
+    )).update_layout(height=800, width=1400)
+    return fig, df
+
+
+def write_replace(path, fig, df):
+    # The previous approach: build the whole table and page as strings, then replace() placeholders
+    table = "".join(task_rows(df, phase_colors))
+    html_string = page_head() + page_header() + "{plot_div}\n{task_details}</div></body></html>"
+    with open(path, 'w', encoding="utf-8") as f:
+        f.write(html_string.replace('{plot_div}', fig.to_html(include_plotlyjs='cdn')).replace('{task_details}', table))
+
+
+def write_streamed(path, fig, df):
+    write_report(path, fig, [("Task Details", "", TASK_COLUMNS, task_rows(df, phase_colors))])
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+if __name__ == "__main__":
+    fig, df = make_report(N_TASKS)
+    print(f"Tasks: {N_TASKS}  (static CSS chunk: {len(PAGE_STYLE) / 1024:.1f} KB)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, func in [("str.replace()", write_replace), ("Streamed", write_streamed)]:
+            path = os.path.join(tmp, "report.html")
+            seconds, peak = measure(func, path, fig, df)
+            size = os.path.getsize(path)
+            print(f"{name:<14} {seconds:6.2f}s  peak {peak / 2**20:7.1f} MB  file {size / 2**20:6.1f} MB")
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+
+import pandas as pd
+import plotly.graph_objects as go
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from gantt_milestones import load_milestones, add_milestones
+
+# ===== BENCHMARK: PER-MILESTONE add_vline() VS BULK LAYOUT UPDATE =====
+N_MILESTONES = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+
+def make_figure():
+    return go.Figure(go.Bar(
+        x=[86400000 * 120], base=[pd.Timestamp("2025-01-01").timestamp() * 1000],
+        y=["Task"], orientation="h"
+    )).update_xaxes(type="date")
+
+
+def make_milestones(n):
+    dates = pd.date_range("2025-01-01", periods=n, freq="6h")
+    colors = ["#E74C3C", "#27AE60", "#45B7D1"]
+    return [
+        {"date": d, "label": f"Milestone {i}", "color": colors[i % len(colors)]}
+        for i, d in enumerate(dates)
+    ]
+
+
+def loop_add_vline(fig, milestones):
+    for milestone in milestones:
+        fig.add_vline(
+            x=pd.to_datetime(milestone["date"]).timestamp() * 1000,
+            line_dash="dash",
+            line_color=milestone["color"],
+            annotation_text=milestone["label"],
+            annotation_position="top",
+            annotation_font_color=milestone["color"],
+            annotation_font_size=10
+        )
+
+
+def bulk_add_milestones(fig, records):
+    # Parse once, then one layout update (parsing is timed too, as in the loop)
+    add_milestones(fig, load_milestones(records))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    records = make_milestones(N_MILESTONES)
+
+    loop_fig, bulk_fig = make_figure(), make_figure()
+    loop_seconds = timed(loop_add_vline, loop_fig, records)
+    bulk_seconds = timed(bulk_add_milestones, bulk_fig, records)
+
+    assert len(loop_fig.layout.shapes) == len(bulk_fig.layout.shapes) == N_MILESTONES
+    assert len(loop_fig.layout.annotations) == len(bulk_fig.layout.annotations) == N_MILESTONES
+
+    print(f"Milestones:        {N_MILESTONES}")
+    print(f"add_vline() loop:  {loop_seconds:.3f}s")
+    print(f"Bulk update:       {bulk_seconds:.3f}s")
+    print(f"Speedup:           {loop_seconds / bulk_seconds:.1f}x")
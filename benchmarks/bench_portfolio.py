@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import plotly.graph_objects as go
+
+from gantt_portfolio import build_portfolio, build_project, phase_colors
+
+# ===== BENCHMARK: PORTFOLIO GENERATION TIME VS WORKER COUNT =====
+N_PROJECTS = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+TASKS_PER_PROJECT = 40
+WORKER_COUNTS = [1, 2, 4, os.cpu_count() or 1]
+
+
+def make_projects(n):
+    phases = list(phase_colors)
+    projects = []
+    for p in range(n):
+        starts = pd.date_range("2025-01-01", periods=TASKS_PER_PROJECT, freq="3D") + pd.Timedelta(days=p % 90)
+        projects.append({
+            "name": f"Project {p:04d}",
+            "tasks": [
+                {
+                    "Task": f"Task {t:02d}",
+                    "Start": start.strftime("%Y-%m-%d"),
+                    "End": (start + pd.Timedelta(days=2 + t % 10)).strftime("%Y-%m-%d"),
+                    "Phase": phases[t * len(phases) // TASKS_PER_PROJECT],
+                    "Progress": (p * 7 + t * 13) % 101
+                }
+                for t, start in enumerate(starts)
+            ],
+            "milestones": [{"date": starts[-1].strftime("%Y-%m-%d"), "label": "Release", "color": "#27AE60"}]
+        })
+    return projects
+
+
+if __name__ == "__main__":
+    projects = make_projects(N_PROJECTS)
+    print(f"Projects: {N_PROJECTS} x {TASKS_PER_PROJECT} tasks")
+
+    # Only per-project building runs in workers; assembly (one validation pass) stays serial
+    start = time.perf_counter()
+    traces = [trace for project in projects for trace in build_project(project)[0]]
+    build_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    go.Figure(data=traces)
+    assembly_seconds = time.perf_counter() - start
+    parallel_share = build_seconds / (build_seconds + assembly_seconds)
+    print(f"Per-project build {build_seconds:.2f}s, assembly {assembly_seconds:.2f}s "
+          f"({parallel_share:.0%} parallelizable)")
+
+    baseline = None
+    for workers in sorted(set(WORKER_COUNTS)):
+        start = time.perf_counter()
+        fig, rollup = build_portfolio(projects, max_workers=workers)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(f"{workers:>3} worker(s): {seconds:.2f}s  ({baseline / seconds:.2f}x, {len(fig.data)} traces)")
@@ -0,0 +1,170 @@
+import gzip
+import io
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from gantt_html import write_page
+
+try:
+    import brotli  # Optional: only needed for .html.br artifacts
+except ImportError:
+    brotli = None
+
+# ===== ARTIFACT FORMATS =====
+ARTIFACT_SUFFIXES = {"html": "", "gz": ".gz", "br": ".br"}
+DEFAULT_LEVELS = {"gz": 9, "br": 11}
+LEVEL_RANGES = {"gz": (0, 9), "br": (0, 11)}
+
+Artifact = namedtuple("Artifact", ["path", "size", "seconds"])
+
+
+class _BrotliFile(io.RawIOBase):
+    """Binary file object that brotli-compresses everything written to it."""
+
+    def __init__(self, path, level):
+        self._file = open(path, 'wb')
+        self._compressor = brotli.Compressor(quality=level)
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._file.write(self._compressor.process(bytes(data)))
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._file.write(self._compressor.finish())
+            self._file.close()
+        super().close()
+
+
+class _TimedSink:
+    """Text sink for one artifact that tracks the time spent writing to it.
+
+    Output goes to a ".part" file: finish() flushes and closes it, and only
+    commit() moves it over `path`, so an existing artifact is never left truncated.
+    """
+
+    def __init__(self, path, fmt, level):
+        self.path = path
+        self.part_path = path + ".part"
+        self.seconds = 0.0
+        start = time.perf_counter()
+        if fmt == "gz":
+            # mtime=0 keeps archived artifacts byte-identical across re-runs
+            raw = gzip.GzipFile(self.part_path, 'wb', compresslevel=level, mtime=0)
+        elif fmt == "br":
+            raw = io.BufferedWriter(_BrotliFile(self.part_path, level), buffer_size=1 << 16)
+        else:
+            raw = open(self.part_path, 'wb')
+        self._file = io.TextIOWrapper(raw, encoding="utf-8")
+        self.seconds += time.perf_counter() - start
+
+    def write(self, text):
+        start = time.perf_counter()
+        self._file.write(text)
+        self.seconds += time.perf_counter() - start
+
+    def finish(self):
+        start = time.perf_counter()
+        self._file.close()
+        self.seconds += time.perf_counter() - start
+
+    def commit(self):
+        os.replace(self.part_path, self.path)
+        return Artifact(self.path, os.path.getsize(self.path), self.seconds)
+
+    def discard(self):
+        try:
+            self._file.close()
+        except Exception:
+            pass  # Already failing; the partial file is removed either way
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+
+class _Tee:
+    """Fans each write out to every artifact, so the page is rendered only once."""
+
+    def __init__(self, sinks):
+        self.sinks = sinks
+
+    def write(self, text):
+        for sink in self.sinks:
+            sink.write(text)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+
+# ===== ARTIFACT WRITERS =====
+def write_artifacts(path, fig, tables=(), formats=("html",), level=None, **page_options):
+    """Stream one report to every requested format and return an Artifact per file.
+
+    `formats` picks from "html" (plain), "gz" (path + ".gz") and "br" (path + ".br").
+    `level` sets the compression level for gzip (0-9) and brotli (0-11); pass a
+    dict like {"gz": 6, "br": 9} to set them separately.
+    Other options (title, subtitle, minify, ...) are passed on to write_page().
+
+    If anything fails, every partial file is removed before the error is re-raised
+    and previously written artifacts at the same paths are left untouched.
+    """
+    unknown = set(formats) - set(ARTIFACT_SUFFIXES)
+    if unknown:
+        raise ValueError(f"Unknown artifact format(s): {', '.join(sorted(unknown))}")
+    if "br" in formats and brotli is None:
+        raise ImportError("Writing .br artifacts requires the 'brotli' package (pip install brotli)")
+    levels = {fmt: _compression_level(fmt, level) for fmt in formats}
+
+    with ExitStack() as cleanup:
+        sinks = []
+        for fmt in formats:
+            sink = _TimedSink(path + ARTIFACT_SUFFIXES[fmt], fmt, levels[fmt])
+            cleanup.callback(sink.discard)
+            sinks.append(sink)
+        write_page(_Tee(sinks), fig, tables, **page_options)
+        # Flush and close every .part file before any of them replaces an existing artifact
+        for sink in sinks:
+            sink.finish()
+        artifacts = [sink.commit() for sink in sinks]
+        cleanup.pop_all()
+    return artifacts
+
+
+def write_batch(jobs, max_workers=None, **options):
+    """Write many reports on a thread pool; returns the artifact list for each job in order.
+
+    `jobs` is an iterable of (path, fig, tables, page_options) tuples; `options`
+    (formats, level, minify, ...) apply to every job. zlib and brotli release the
+    GIL while compressing, which is where the threads can overlap; measure it
+    with benchmarks/bench_artifacts.py.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(write_artifacts, path, fig, tables, **options, **page_options)
+            for path, fig, tables, page_options in jobs
+        ]
+        return [future.result() for future in futures]
+
+
+def _compression_level(fmt, level):
+    if fmt not in LEVEL_RANGES:
+        return None
+    if isinstance(level, dict):
+        level = level.get(fmt)
+    if level is None:
+        return DEFAULT_LEVELS[fmt]
+    low, high = LEVEL_RANGES[fmt]
+    if isinstance(level, bool) or not isinstance(level, int) or not low <= level <= high:
+        raise ValueError(f"Compression level for '{fmt}' must be an integer from {low} to {high}, got {level!r}")
+    return level
+
+
+def print_artifacts(artifacts):
+    for artifact in artifacts:
+        print(f"  {artifact.path:<40} {artifact.size / 1024:10.1f} KB  {artifact.seconds * 1000:8.1f} ms")
@@ -0,0 +1,106 @@
+import json
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# ===== TEAM CALENDARS =====
+DEFAULT_WEEKMASK = "Mon Tue Wed Thu Fri"
+
+team_calendars = {
+    "default": {"weekmask": DEFAULT_WEEKMASK, "holidays": []},
+}
+
+
+@lru_cache(maxsize=None)
+def _busdaycalendar(weekmask, holidays):
+    return np.busdaycalendar(weekmask=weekmask, holidays=list(holidays))
+
+
+def get_calendar(weekmask=DEFAULT_WEEKMASK, holidays=()):
+    """Return the cached numpy business-day calendar for a weekly mask and holiday list.
+
+    `weekmask` is a string ("Mon Tue Wed Thu Fri" or "1111100") or seven 1/0 flags.
+    """
+    if not isinstance(weekmask, str):
+        weekmask = tuple(weekmask)  # JSON lists are unhashable cache keys
+    holidays = tuple(sorted(np.asarray(holidays, dtype="datetime64[D]").tolist()))
+    return _busdaycalendar(weekmask, holidays)
+
+
+def _team_calendar(team, calendars):
+    spec = calendars.get(team) or calendars.get("default") or {}
+    return get_calendar(spec.get("weekmask", DEFAULT_WEEKMASK), spec.get("holidays", ()))
+
+
+def _as_days(dates):
+    return np.asarray(pd.to_datetime(dates), dtype="datetime64[D]")
+
+
+# ===== VECTORIZED WORKING-DAY MATH =====
+def working_days(start, end, calendar=None):
+    """Count working days between start and end, inclusive of both (like Duration)."""
+    calendar = calendar or get_calendar()
+    return np.busday_count(_as_days(start), _as_days(end) + 1, busdaycal=calendar)
+
+
+def shift_end(start, days, calendar=None):
+    """Return the end date of a task starting on `start` that takes `days` working days.
+
+    A start on a non-working day rolls forward to the next working day first.
+    """
+    calendar = calendar or get_calendar()
+    days = np.maximum(np.asarray(days, dtype="int64"), 1)
+    return np.busday_offset(_as_days(start), days - 1, roll="forward", busdaycal=calendar)
+
+
+def load_calendars(path):
+    """Load team calendars from a JSON file mapping team -> {"weekmask": ..., "holidays": [...]}.
+
+    Teams missing from the file keep using "default", which falls back to the
+    built-in Monday-Friday calendar when the file does not define it.
+    """
+    with open(path) as f:
+        calendars = json.load(f)
+    if not isinstance(calendars, dict):
+        raise ValueError(f"{path}: expected an object mapping team names to calendars, "
+                         f"got {type(calendars).__name__}")
+    for team, spec in calendars.items():
+        try:
+            get_calendar(spec.get("weekmask", DEFAULT_WEEKMASK), spec.get("holidays", ()))
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(f"{path}: invalid calendar for team '{team}': {e}") from None
+    return {**team_calendars, **calendars}
+
+
+def _by_team(df, calendars, team_col):
+    # Yield (row positions, calendar) so each calendar is applied in one vectorized call
+    calendars = calendars or team_calendars
+    if team_col not in df:
+        yield np.arange(len(df)), _team_calendar("default", calendars)
+        return
+    for team, rows in df.groupby(team_col, sort=False, dropna=False).indices.items():
+        yield rows, _team_calendar(team, calendars)
+
+
+def team_working_days(df, calendars=None, team_col="Team"):
+    """Working-day durations for each task, using the calendar of the task's team.
+
+    Teams without their own calendar (or a missing team column) use "default".
+    """
+    result = np.zeros(len(df), dtype="int64")
+    for rows, calendar in _by_team(df, calendars, team_col):
+        result[rows] = working_days(df['Start'].iloc[rows], df['End'].iloc[rows], calendar)
+    return pd.Series(result, index=df.index)
+
+
+def team_working_end(df, calendars=None, team_col="Team", days_col="Duration"):
+    """End dates if each task's `days_col` length is worked on its team's working days only.
+
+    With the default Duration column this is where the planned end lands once
+    weekends and holidays are skipped, i.e. the calendar-shifted end date.
+    """
+    result = np.empty(len(df), dtype="datetime64[D]")
+    for rows, calendar in _by_team(df, calendars, team_col):
+        result[rows] = shift_end(df['Start'].iloc[rows], df[days_col].iloc[rows], calendar)
+    return pd.Series(pd.to_datetime(result), index=df.index)
@@ -0,0 +1,704 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
+
+# ===== STATIC PAGE CHUNKS =====
+# Built once at import and written as-is, so the CSS is never copied into a
+# per-report string and the plot payload is never run through str.replace().
+PAGE_TITLE = "Project Gantt Chart | Modern Dashboard"
+
+HEAD_OPEN = '''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8" />
+'''
+
+PAGE_STYLE = '''
+    <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@300;400;700&family=Inter:wght@300;400;600&display=swap" rel="stylesheet">
+    <style>
+        /* Reset and base styles */
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        /* Screen styles */
+        @media screen {
+            body {
+                font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+                background: linear-gradient(135deg, #0A0E27 0%, #151932 50%, #0A0E27 100%);
+                color: #E0E6ED;
+                min-height: 100vh;
+                position: relative;
+                overflow-x: hidden;
+            }
+            
+            /* Animated background grid */
+            body::before {
+                content: '';
+                position: fixed;
+                top: 0;
+                left: 0;
+                width: 100%;
+                height: 100%;
+                background-image: 
+                    repeating-linear-gradient(0deg, transparent, transparent 70px, rgba(0, 212, 255, 0.03) 70px, rgba(0, 212, 255, 0.03) 71px),
+                    repeating-linear-gradient(90deg, transparent, transparent 70px, rgba(0, 212, 255, 0.03) 70px, rgba(0, 212, 255, 0.03) 71px);
+                pointer-events: none;
+                z-index: 1;
+            }
+            
+            /* Glow effects */
+            .glow {
+                position: fixed;
+                width: 500px;
+                height: 500px;
+                border-radius: 50%;
+                background: radial-gradient(circle, rgba(0, 212, 255, 0.1) 0%, transparent 70%);
+                pointer-events: none;
+                z-index: 1;
+                animation: floatGlow 20s infinite ease-in-out;
+            }
+            
+            @keyframes floatGlow {
+                0%, 100% { transform: translate(0, 0) scale(1); }
+                33% { transform: translate(30px, -30px) scale(1.1); }
+                66% { transform: translate(-20px, 20px) scale(0.9); }
+            }
+            
+            h1 {
+                font-family: 'JetBrains Mono', monospace;
+                font-size: 3.5rem;
+                font-weight: 700;
+                letter-spacing: -2px;
+                background: linear-gradient(45deg, #00D4FF, #00FFF0, #9D4EDD);
+                -webkit-background-clip: text;
+                -webkit-text-fill-color: transparent;
+                background-clip: text;
+                filter: drop-shadow(0 0 20px rgba(0, 212, 255, 0.5));
+            }
+            
+            .glass-btn {
+                position: relative;
+                padding: 15px 40px;
+                background: rgba(255, 255, 255, 0.05);
+                backdrop-filter: blur(10px);
+                border: 1px solid rgba(255, 255, 255, 0.1);
+                border-radius: 50px;
+                color: #E0E6ED;
+                font-family: 'JetBrains Mono', monospace;
+                font-size: 14px;
+                font-weight: 500;
+                letter-spacing: 1px;
+                cursor: pointer;
+                transition: all 0.3s ease;
+                text-transform: uppercase;
+            }
+            
+            .glass-btn.primary {
+                border-color: rgba(0, 212, 255, 0.5);
+                background: rgba(0, 212, 255, 0.1);
+            }
+            
+            .chart-wrapper {
+                background: rgba(255, 255, 255, 0.02);
+                backdrop-filter: blur(20px);
+                border: 1px solid rgba(255, 255, 255, 0.1);
+                border-radius: 20px;
+                padding: 30px;
+                margin: 30px 0;
+                box-shadow: 0 20px 50px rgba(0, 0, 0, 0.5);
+            }
+            
+            .task-details-page {
+                background: rgba(255, 255, 255, 0.02);
+                backdrop-filter: blur(20px);
+                border: 1px solid rgba(255, 255, 255, 0.1);
+                border-radius: 20px;
+                padding: 40px;
+                margin: 40px 0;
+            }
+            
+            .phase-badge {
+                color: #FFFFFF;
+                text-shadow: 0 1px 2px rgba(0, 0, 0, 0.4);
+            }
+            
+            .progress-bar {
+                background: rgba(255, 255, 255, 0.03);
+                border: 1px solid rgba(255, 255, 255, 0.1);
+            }
+            
+            .progress-fill {
+                background: linear-gradient(90deg, #00D4FF, #45B7D1);
+                box-shadow: inset 0 0 10px rgba(0, 0, 0, 0.2);
+            }
+        }
+        
+        /* PRINT STYLES - CRITICAL FOR PDF EXPORT */
+        @media print {
+            @page {
+                size: A4 landscape;
+                margin: 10mm;
+            }
+            
+            body {
+                font-family: Arial, sans-serif !important;
+                background: white !important;
+                color: black !important;
+                margin: 0;
+                padding: 0;
+            }
+            
+            /* Hide screen-only elements */
+            body::before,
+            .glow,
+            .download-section {
+                display: none !important;
+            }
+            
+            /* Container adjustments */
+            .container {
+                max-width: 100% !important;
+                padding: 0 !important;
+            }
+            
+            /* Header styles for print */
+            .header {
+                page-break-after: avoid;
+                margin-bottom: 20px !important;
+            }
+            
+            h1 {
+                font-family: Arial, sans-serif !important;
+                font-size: 28pt !important;
+                color: #2C3E50 !important;
+                background: none !important;
+                -webkit-text-fill-color: #2C3E50 !important;
+                filter: none !important;
+                text-align: center;
+                margin-bottom: 10px;
+            }
+            
+            .subtitle {
+                font-size: 14pt !important;
+                color: #555 !important;
+                text-align: center;
+            }
+            
+            /* Chart wrapper for print */
+            .chart-wrapper {
+                background: white !important;
+                border: 1px solid #ddd !important;
+                border-radius: 0 !important;
+                padding: 10px !important;
+                box-shadow: none !important;
+                page-break-inside: avoid;
+                margin: 20px 0 !important;
+            }
+            
+            /* Plotly chart specific */
+            .plotly-graph-div {
+                width: 100% !important;
+                height: auto !important;
+                background: white !important;
+            }
+            
+            /* Force white background on plotly elements */
+            .plotly .bg {
+                fill: white !important;
+            }
+            
+            .js-plotly-plot .plotly {
+                background: white !important;
+            }
+            
+            /* Only fix specific problematic backgrounds, don't mess with text */
+            .plotly .bg {
+                fill: white !important;
+            }
+            
+            /* Hide range slider in print */
+            .rangeslider-container {
+                display: none !important;
+            }
+            
+            /* Remove grey boxes from plotly chart in print */
+            .plot .bg,
+            .plot .plotbg,
+            .plot rect[fill="#f5f5f5"],
+            .plot rect[fill="#ffffff"],
+            .plot rect[fill="white"],
+            .plot rect[fill="rgb(245,245,245)"],
+            .plot .nsewdrag {
+                fill: white !important;
+                stroke: none !important;
+            }
+            
+            /* Target specific plotly background elements */
+            .plotly .bg,
+            .plotly .plotbg,
+            .js-plotly-plot .bg,
+            .js-plotly-plot .plotbg {
+                fill: white !important;
+                stroke: none !important;
+            }
+            
+            /* Remove any grey backgrounds on plotly text elements */
+            .plotly text,
+            .js-plotly-plot text {
+                background: none !important;
+                background-color: transparent !important;
+            }
+            
+            /* Target specific Plotly grey hex colors */
+            rect[fill="#C8D4E3"],
+            rect[fill="#EBF0F8"], 
+            rect[fill="#E5ECF6"],
+            rect[fill="#c8d4e3"],
+            rect[fill="#ebf0f8"],
+            rect[fill="#e5ecf6"] {
+                fill: white !important;
+                stroke: white !important;
+            }
+            
+            /* Target any remaining grey backgrounds in SVG */
+            .plotly .bg,
+            .plotly .plot .bg,
+            .js-plotly-plot .bg,
+            .js-plotly-plot .plot .bg,
+            svg rect[fill*="#C8D4E3"],
+            svg rect[fill*="#EBF0F8"],
+            svg rect[fill*="#E5ECF6"],
+            svg rect[fill*="rgb(200,212,227)"],
+            svg rect[fill*="rgb(235,240,248)"],
+            svg rect[fill*="rgb(229,236,246)"] {
+                fill: white !important;
+                stroke: none !important;
+            }
+            
+            /* Task details page */
+            .task-details-page {
+                background: white !important;
+                border: none !important;
+                padding: 20px 0 !important;
+                page-break-before: always;
+                margin-top: 0 !important;
+            }
+            
+            
+            .section-title {
+                font-size: 20pt !important;
+                color: #2C3E50 !important;
+                margin-bottom: 10px !important;
+                text-align: center;
+            }
+            
+            .section-subtitle {
+                font-size: 12pt !important;
+                color: #666 !important;
+                text-align: center;
+                margin-bottom: 20px;
+            }
+            
+            /* Table styles for print */
+            .task-table {
+                width: 100% !important;
+                border-collapse: collapse !important;
+                font-size: 10pt !important;
+            }
+            
+            .task-table th {
+                background-color: #f5f5f5 !important;
+                color: #333 !important;
+                padding: 8px !important;
+                border: 1px solid #ddd !important;
+                font-weight: bold !important;
+                text-transform: uppercase;
+                font-size: 9pt !important;
+            }
+            
+            .task-table td {
+                padding: 6px !important;
+                border: 1px solid #ddd !important;
+                color: #333 !important;
+                background: white !important;
+            }
+            
+            .task-table tr:nth-child(even) td {
+                background-color: #fafafa !important;
+            }
+            
+            /* Force white background for table rows */
+            .task-table tbody tr {
+                background: white !important;
+            }
+            
+            /* Only target specific problem areas */
+            .section-title, .section-subtitle {
+                background: transparent !important;
+                background-color: transparent !important;
+            }
+            
+            /* Ensure all text is readable in print */
+            * {
+                -webkit-print-color-adjust: exact !important;
+                print-color-adjust: exact !important;
+            }
+            
+            .task-name {
+                font-weight: bold !important;
+                color: #2C3E50 !important;
+            }
+            
+            /* Phase badges for print - remove all styling to eliminate grey boxes */
+            .phase-badge {
+                display: inline !important;
+                background: none !important;
+                background-color: transparent !important;
+                border: none !important;
+                border-radius: 0 !important;
+                padding: 0 !important;
+                margin: 0 !important;
+                box-shadow: none !important;
+                font-size: 10pt !important;
+                font-weight: bold !important;
+                color: #333 !important;
+                text-shadow: none !important;
+            }
+            
+            /* Progress bars for print */
+            .progress-bar {
+                position: relative !important;
+                width: 100% !important;
+                height: 20px !important;
+                background: #f0f0f0 !important;
+                border: 1px solid #ccc !important;
+                border-radius: 10px !important;
+                overflow: hidden !important;
+                print-color-adjust: exact !important;
+                -webkit-print-color-adjust: exact !important;
+            }
+            
+            .progress-fill {
+                height: 100% !important;
+                background: #4CAF50 !important;
+                border-radius: 10px !important;
+                print-color-adjust: exact !important;
+                -webkit-print-color-adjust: exact !important;
+            }
+            
+            .progress-text {
+                position: absolute !important;
+                top: 50% !important;
+                left: 50% !important;
+                transform: translate(-50%, -50%) !important;
+                font-size: 9pt !important;
+                font-weight: bold !important;
+                color: #333 !important;
+                text-shadow: none !important;
+                z-index: 1;
+            }
+        }
+        
+        /* Common styles */
+        .container {
+            position: relative;
+            z-index: 2;
+            max-width: 1400px;
+            margin: 0 auto;
+            padding: 40px 20px;
+        }
+        
+        .header {
+            text-align: center;
+            margin-bottom: 50px;
+            position: relative;
+        }
+        
+        .subtitle {
+            font-family: 'JetBrains Mono', monospace;
+            font-size: 1rem;
+            color: #64748B;
+            margin-top: 10px;
+            letter-spacing: 4px;
+            text-transform: uppercase;
+        }
+        
+        .download-section {
+            display: flex;
+            justify-content: center;
+            gap: 20px;
+            margin: 40px 0;
+            flex-wrap: wrap;
+        }
+        
+        .section-title {
+            font-family: 'JetBrains Mono', monospace;
+            font-size: 2rem;
+            text-align: center;
+            margin-bottom: 10px;
+            background: linear-gradient(45deg, #00D4FF, #9D4EDD);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            background-clip: text;
+        }
+        
+        .section-subtitle {
+            text-align: center;
+            color: #64748B;
+            font-style: italic;
+            margin-bottom: 30px;
+            font-size: 14px;
+        }
+        
+        .task-table {
+            width: 100%;
+            border-collapse: separate;
+            border-spacing: 0 10px;
+        }
+        
+        .task-table th {
+            font-family: 'JetBrains Mono', monospace;
+            font-size: 12px;
+            font-weight: 600;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            color: #64748B;
+            padding: 15px;
+            text-align: left;
+            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+        }
+        
+        .task-table tr {
+            background: rgba(255, 255, 255, 0.02);
+            transition: all 0.3s ease;
+        }
+        
+        .task-table tbody tr:hover {
+            background: rgba(255, 255, 255, 0.05);
+            transform: translateX(5px);
+        }
+        
+        .task-table td {
+            padding: 15px;
+            color: #E0E6ED;
+            border-top: 1px solid rgba(255, 255, 255, 0.05);
+            border-bottom: 1px solid rgba(255, 255, 255, 0.05);
+        }
+        
+        .task-name {
+            font-weight: 600;
+            color: #00D4FF;
+        }
+        
+        .phase-badge {
+            display: inline-block;
+            padding: 6px 16px;
+            border-radius: 20px;
+            font-size: 13px;
+            font-weight: 700;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            color: #FFFFFF;
+            text-shadow: 0 1px 2px rgba(0, 0, 0, 0.4);
+            box-shadow: 0 2px 10px rgba(0, 0, 0, 0.3);
+            border: 1px solid rgba(0, 0, 0, 0.2);
+        }
+        
+        .progress-bar {
+            position: relative;
+            width: 100%;
+            height: 28px;
+            background: rgba(255, 255, 255, 0.03);
+            border-radius: 14px;
+            overflow: hidden;
+            border: 1px solid rgba(255, 255, 255, 0.1);
+        }
+        
+        .progress-fill {
+            height: 100%;
+            background: linear-gradient(90deg, #00D4FF, #45B7D1);
+            border-radius: 14px;
+            transition: width 0.6s ease;
+            box-shadow: inset 0 0 10px rgba(0, 0, 0, 0.2);
+            position: relative;
+        }
+        
+        .progress-text {
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            font-size: 12px;
+            font-weight: 700;
+            color: #FFFFFF;
+            text-shadow: 0 1px 3px rgba(0, 0, 0, 0.8);
+            z-index: 1;
+        }
+    </style>
+'''
+
+BODY_OPEN = '''</head>
+<body>
+    <div class="glow" style="top: -250px; left: -250px;"></div>
+    <div class="glow" style="background: radial-gradient(circle, rgba(157, 78, 221, 0.1) 0%, transparent 70%); right: -250px; top: 60%;"></div>
+    
+    <div class="container">
+'''
+
+CHART_CLOSE = '''
+        </div>
+        
+'''
+
+TABLE_CLOSE = '''
+        </tbody>
+    </table>
+</div>
+'''
+
+PAGE_FOOTER = '''    </div>
+</body>
+</html>
+'''
+
+PLOTLY_CDN = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_style(html):
+    """Minify every embedded <style> block, leaving the surrounding markup untouched."""
+    return re.sub(r"(<style>)(.*?)(</style>)", lambda m: m[1] + minify_css(m[2]) + m[3], html, flags=re.S)
+
+
+@lru_cache(maxsize=None)
+def page_head(title=PAGE_TITLE, minify=False):
+    style = minify_style(PAGE_STYLE) if minify else PAGE_STYLE
+    return HEAD_OPEN + f"    <title>{title}</title>" + style + BODY_OPEN
+
+
+@lru_cache(maxsize=None)
+def page_header(title="PROJECT GANTT CHART", subtitle="Software Development Lifecycle"):
+    return f'''        <div class="header">
+            <h1>{title}</h1>
+            <p class="subtitle">{subtitle}</p>
+        </div>
+        
+        <div class="download-section">
+            <button class="glass-btn primary" onclick="window.print()">Export PDF</button>
+        </div>
+        
+        <div class="chart-wrapper">
+'''
+
+
+@lru_cache(maxsize=None)
+def table_open(title, subtitle, columns):
+    headers = "".join(f"\n                <th>{column}</th>" for column in columns)
+    return f'''
+<div class="task-details-page">
+    <h2 class="section-title">{title}</h2>
+    <p class="section-subtitle">{subtitle}</p>
+    <table class="task-table">
+        <thead>
+            <tr>{headers}
+            </tr>
+        </thead>
+        <tbody>'''
+
+
+# ===== TABLE ROWS =====
+TASK_COLUMNS = ("Task", "Phase", "Start Date", "End Date", "Duration", "Working-Day End", "Progress (Projected)")
+
+
+def format_dates(dates, fmt='%B %d, %Y'):
+    # Tasks share far fewer distinct dates than rows, so strftime() each date only once.
+    # factorize() codes missing dates as -1; a trailing "" keeps them blank instead of
+    # wrapping around to the last distinct date.
+    codes, uniques = pd.factorize(dates)
+    formatted = np.append(np.asarray(uniques.strftime(fmt), dtype=object), "")
+    return formatted[codes].tolist()
+
+
+def progress_cell(progress):
+    return f'''
+                <td>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: {progress}%"></div>
+                        <span class="progress-text">{progress}%</span>
+                    </div>
+                </td>'''
+
+
+def task_rows(df, phase_colors):
+    """Yield one task table row at a time instead of concatenating the whole table."""
+    columns = zip(
+        df['Task'].tolist(), df['Phase'].tolist(), df['Phase'].map(phase_colors).fillna('#000000').tolist(),
+        format_dates(df['Start']), format_dates(df['End']), format_dates(df['Working_End']),
+        df['Duration'].tolist(), df['Working_Days'].tolist(), df['Progress'].tolist()
+    )
+    for task, phase, color, start, end, working_end, duration, working_days, progress in columns:
+        yield f'''
+            <tr>
+                <td class="task-name">{task}</td>
+                <td><span class="phase-badge" style="background-color: {color};">{phase}</span></td>
+                <td>{start}</td>
+                <td>{end}</td>
+                <td>{duration} days ({working_days} working)</td>
+                <td>{working_end}</td>{progress_cell(progress)}
+            </tr>'''
+
+
+# ===== STREAMING PAGE WRITER =====
+def write_plot(f, fig, div_id="gantt-chart"):
+    """Write the plot div and its Plotly.newPlot() call, streaming the figure JSON."""
+    height = f"{fig.layout.height}px" if fig.layout.height else "100%"
+    width = f"{fig.layout.width}px" if fig.layout.width else "100%"
+    f.write(f'''            <div id="{div_id}" class="plotly-graph-div" style="height:{height}; width:{width};"></div>
+            <script charset="utf-8" src="{PLOTLY_CDN}"></script>
+            <script>
+                var figure = ''')
+    # pio.to_json() escapes "</" so the payload cannot close the script tag early
+    f.write(pio.to_json(fig, validate=False))
+    f.write(f''';
+                Plotly.newPlot("{div_id}", figure.data, figure.layout, {{"responsive": true}});
+            </script>''')
+
+
+def write_page(f, fig, tables=(), title="PROJECT GANTT CHART", subtitle="Software Development Lifecycle",
+               page_title=PAGE_TITLE, minify=False):
+    """Stream a full report page to an open text file.
+
+    `tables` is an iterable of (heading, subheading, columns, rows) where rows is
+    an iterable of <tr> strings; each row is written as soon as it is produced.
+    `minify` writes the embedded <style> block minified.
+    """
+    f.write(page_head(page_title, minify))
+    f.write(page_header(title, subtitle))
+    write_plot(f, fig)
+    f.write(CHART_CLOSE)
+    for heading, subheading, columns, rows in tables:
+        f.write(table_open(heading, subheading, tuple(columns)))
+        f.writelines(rows)
+        f.write(TABLE_CLOSE)
+    f.write(PAGE_FOOTER)
+
+
+def write_report(path, fig, tables=(), **page_options):
+    with open(path, 'w', encoding="utf-8") as f:
+        write_page(f, fig, tables, **page_options)
+    return path
@@ -0,0 +1,71 @@
+import pandas as pd
+
+# ===== MILESTONE LOADING =====
+MILESTONE_COLUMNS = ["date", "label", "color"]
+DEFAULT_MILESTONE_COLOR = "#2C3E50"
+
+
+def load_milestones(records):
+    """Normalize milestone records (list of dicts, DataFrame or CSV path) into a DataFrame."""
+    if isinstance(records, str):
+        milestones = pd.read_csv(records)
+    else:
+        milestones = pd.DataFrame(records, columns=MILESTONE_COLUMNS)
+
+    milestones = milestones.reindex(columns=MILESTONE_COLUMNS)
+    # utc=True treats naive dates as UTC and converts aware ones, as Timestamp.timestamp() did before
+    dates = pd.to_datetime(milestones["date"], errors="coerce", utc=True)
+    if dates.isna().any():
+        bad = milestones.loc[dates.isna(), "date"].tolist()
+        raise ValueError(f"Milestone dates missing or unparseable: {bad}")
+    milestones["date"] = dates.dt.tz_localize(None)
+    milestones["label"] = milestones["label"].fillna("").astype(str)
+    milestones["color"] = milestones["color"].fillna(DEFAULT_MILESTONE_COLOR)
+    return milestones.sort_values("date", kind="stable").reset_index(drop=True)
+
+
+# ===== BULK MILESTONE RENDERING =====
+def milestone_shapes(milestones):
+    """Build the same dashed vertical line shapes that fig.add_vline() would create."""
+    return [
+        dict(
+            type="line",
+            xref="x", yref="y domain",
+            x0=x, x1=x, y0=0, y1=1,
+            line=dict(color=color, dash="dash")
+        )
+        for x, color in zip(_milestone_x(milestones), milestones["color"])
+    ]
+
+
+def milestone_annotations(milestones):
+    """Build the 'top' labels that fig.add_vline(annotation_position="top") would create."""
+    return [
+        dict(
+            text=label,
+            xref="x", yref="y domain",
+            x=x, y=1,
+            xanchor="center", yanchor="bottom",
+            showarrow=False,
+            font=dict(color=color, size=10)
+        )
+        for x, label, color in zip(_milestone_x(milestones), milestones["label"], milestones["color"])
+    ]
+
+
+def add_milestones(fig, milestones):
+    """Add all milestones (a DataFrame from load_milestones()) with a single layout update.
+
+    Looping fig.add_vline() rebuilds and revalidates the layout's shapes and
+    annotations tuples on every call, which is quadratic in the milestone count.
+    """
+    fig.update_layout(
+        shapes=list(fig.layout.shapes) + milestone_shapes(milestones),
+        annotations=list(fig.layout.annotations) + milestone_annotations(milestones)
+    )
+    return fig
+
+
+def _milestone_x(milestones):
+    # Plotly date axes take epoch milliseconds, same as the original add_vline() loop
+    return (milestones["date"].astype("datetime64[ms]").astype("int64")).tolist()
@@ -0,0 +1,310 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from gantt_artifacts import ARTIFACT_SUFFIXES, print_artifacts, write_artifacts, write_batch
+from gantt_calendar import load_calendars, team_working_days, team_working_end
+from gantt_html import progress_cell
+from gantt_milestones import load_milestones
+
+# ===== PORTFOLIO CONFIGURATION =====
+phase_colors = {
+    "Planning": "#FF6B6B",
+    "Design": "#4ECDC4",
+    "Approval": "#FFE66D",
+    "Development": "#45B7D1",
+    "Testing": "#96CEB4",
+    "Deployment": "#9B59B6"
+}
+
+DEFAULT_PHASE = "Unassigned"
+DEFAULT_PHASE_COLOR = "#95A5A6"
+TASK_REQUIRED_COLUMNS = ["Task", "Start", "End"]
+ROLLUP_COLUMNS = ["Project", "Tasks", "Start", "End", "Duration", "Progress"]
+ROLLUP_TABLE_COLUMNS = ("Project", "Tasks", "Start Date", "End Date", "Duration", "Progress")
+
+
+# ===== PROJECT LOADING =====
+def load_project(source, calendars=None):
+    """Load and validate one project from a JSON/CSV path or a {"name": ..., "tasks": [...]} dict.
+
+    JSON files use the same shape as the dict form; CSV files hold the task rows
+    (Task, Start, End, Phase, Progress) and take the project name from the file name.
+    Working days use `calendars` (team -> weekmask/holidays), defaulting to gantt_calendar.team_calendars.
+    Raises ValueError naming the project file when its tasks cannot be charted.
+    """
+    if isinstance(source, dict):
+        name, tasks, milestones = source["name"], source["tasks"], source.get("milestones", [])
+        label = f"project '{name}'"
+    elif source.endswith(".csv"):
+        name = os.path.splitext(os.path.basename(source))[0]
+        tasks, milestones = pd.read_csv(source), []
+        label = source
+    else:
+        with open(source) as f:
+            project = json.load(f)
+        name = project.get("name", os.path.splitext(os.path.basename(source))[0])
+        tasks, milestones = project.get("tasks", []), project.get("milestones", [])
+        label = source
+
+    df = pd.DataFrame(tasks)
+    if df.empty:
+        raise ValueError(f"{label}: project has no tasks")
+    missing = [column for column in TASK_REQUIRED_COLUMNS if column not in df]
+    if missing:
+        raise ValueError(f"{label}: tasks are missing column(s) {', '.join(missing)}")
+
+    df['Start'] = pd.to_datetime(df['Start'], errors="coerce")
+    df['End'] = pd.to_datetime(df['End'], errors="coerce")
+    undated = df.loc[df['Start'].isna() | df['End'].isna(), 'Task'].tolist()
+    if undated:
+        raise ValueError(f"{label}: missing or unparseable Start/End for task(s) {undated}")
+    reversed_tasks = df.loc[df['End'] < df['Start'], 'Task'].tolist()
+    if reversed_tasks:
+        raise ValueError(f"{label}: End is before Start for task(s) {reversed_tasks}")
+
+    df['Phase'] = df['Phase'].fillna(DEFAULT_PHASE) if 'Phase' in df else DEFAULT_PHASE
+    df['Progress'] = df['Progress'].fillna(0) if 'Progress' in df else 0
+    df['Duration'] = (df['End'] - df['Start']).dt.days + 1
+    df['Working_Days'] = team_working_days(df, calendars)
+    df['Working_End'] = team_working_end(df, calendars)
+    try:
+        milestones = load_milestones(milestones)
+    except ValueError as e:
+        raise ValueError(f"{label}: {e}") from None
+    return name, df, milestones
+
+
+# ===== PER-PROJECT TRACE BUILDING (RUNS IN WORKER PROCESSES) =====
+def project_milestone_traces(name, df, milestones):
+    """Draw a project's milestones as dashed lines spanning only that project's rows.
+
+    They share the project's legend group, so they collapse with it instead of
+    stacking across the whole shared axis like layout shapes would.
+    """
+    y = [[name] * len(df), df['Task'].tolist()]
+    text_blanks = [""] * (len(df) - 1)
+    return [
+        dict(
+            type="scatter",
+            name="Milestones",
+            mode="lines+text",
+            x=[date.strftime('%Y-%m-%d')] * len(df), y=y,
+            text=[label] + text_blanks,
+            textposition="top right",
+            line=dict(dash="dash", color=color),
+            textfont=dict(color=color, size=10),
+            hovertemplate=f"{label}<br>{date.strftime('%B %d, %Y')}<extra>{name}</extra>",
+            legendgroup=name,
+            legendgrouptitle_text=name,
+            showlegend=i == 0
+        )
+        for i, (date, label, color) in enumerate(zip(milestones['date'], milestones['label'], milestones['color']))
+    ]
+
+
+def build_project(source, colors=None, calendars=None):
+    """Build the trace dicts and roll-up row for one project.
+
+    Traces are plain dicts, which pickle cheaply back to the parent process and
+    are validated once there when the figure is assembled.
+    """
+    colors = colors or phase_colors
+    name, df, milestones = load_project(source, calendars)
+
+    start_ms = df['Start'].to_numpy(dtype="datetime64[ms]").astype("int64")
+    width_ms = df['End'].to_numpy(dtype="datetime64[ms]").astype("int64") - start_ms
+    tasks = df['Task'].to_numpy(dtype=object)
+    hover_text = (
+        "<b>" + df['Task'].astype(str) + "</b><br>" +
+        "Project: " + name + "<br>" +
+        "Phase: " + df['Phase'].astype(str) + "<br>" +
+        "Start: " + df['Start'].dt.strftime('%B %d, %Y') + "<br>" +
+        "End: " + df['End'].dt.strftime('%B %d, %Y') + "<br>" +
+        "Duration: " + df['Duration'].astype(str) + " days (" + df['Working_Days'].astype(str) + " working)<br>" +
+        "Working-day end: " + df['Working_End'].dt.strftime('%B %d, %Y') + "<br>" +
+        "Progress: " + df['Progress'].astype(str) + "%"
+    ).to_numpy(dtype=object)
+
+    traces = []
+    # Positional numpy indexing per phase; label-based .loc dominated the per-project time
+    for phase, rows in df.groupby('Phase', sort=False).indices.items():
+        traces.append(dict(
+            type="bar",
+            name=phase,
+            orientation="h",
+            y=[[name] * len(rows), tasks[rows].tolist()],
+            base=start_ms[rows].tolist(),
+            x=width_ms[rows].tolist(),
+            marker=dict(color=colors.get(phase, DEFAULT_PHASE_COLOR)),
+            hovertext=hover_text[rows].tolist(),
+            hovertemplate="%{hovertext}<extra></extra>",
+            legendgroup=name,
+            legendgrouptitle_text=name
+        ))
+    traces += project_milestone_traces(name, df, milestones)
+
+    rollup = {
+        "Project": name,
+        "Tasks": len(df),
+        "Start": df['Start'].min(),
+        "End": df['End'].max(),
+        "Duration": (df['End'].max() - df['Start'].min()).days + 1,
+        # Duration-weighted so long tasks count for more than one-day sign-offs
+        "Progress": round(float((df['Progress'] * df['Duration']).sum() / df['Duration'].sum()), 1)
+    }
+    return traces, rollup
+
+
+# ===== PORTFOLIO ASSEMBLY =====
+def build_projects(sources, max_workers=None, colors=None, calendars=None):
+    """Run build_project() for every source in worker processes, keeping input order.
+
+    Raises ValueError if two projects share a name, since the name is both their
+    y-axis group and their legend group.
+    """
+    sources = list(sources)
+    if max_workers == 1:
+        results = [build_project(source, colors, calendars) for source in sources]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            chunksize = max(1, len(sources) // ((max_workers or os.cpu_count() or 1) * 4))
+            results = list(pool.map(build_project, sources, [colors] * len(sources), [calendars] * len(sources),
+                                    chunksize=chunksize))
+    _check_unique_names(sources, results)
+    return results
+
+
+def _check_unique_names(sources, results):
+    used_by = {}
+    for i, (source, (_, rollup)) in enumerate(zip(sources, results)):
+        used_by.setdefault(rollup["Project"], []).append(source if isinstance(source, str) else f"project #{i + 1}")
+    clashes = [f"'{name}' ({', '.join(labels)})" for name, labels in used_by.items() if len(labels) > 1]
+    if clashes:
+        raise ValueError(f"Duplicate project name(s): {'; '.join(clashes)}. "
+                         f"Give each project a unique \"name\" or file name.")
+
+
+def build_portfolio(sources, max_workers=None, colors=None, calendars=None):
+    """Build every project in parallel and assemble one figure plus a roll-up table."""
+    return assemble_portfolio(build_projects(sources, max_workers, colors, calendars))
+
+
+def assemble_portfolio(results):
+    """Assemble build_project() results into one figure plus a roll-up table.
+
+    Projects share one date axis and are grouped on a two-level (project, task)
+    y axis; each project (with its milestones) is one legend group, so clicking
+    its title collapses it.
+    """
+    traces = [trace for project_traces, _ in results for trace in project_traces]
+    rollup = pd.DataFrame([row for _, row in results], columns=ROLLUP_COLUMNS)
+
+    # Build the figure in one go rather than add_trace() per project; this is the only validation pass
+    fig = go.Figure(data=traces)
+    fig.update_yaxes(autorange="reversed", type="multicategory", showgrid=True, gridcolor='#E0E0E0')
+    fig.update_layout(
+        height=max(800, 22 * int(rollup['Tasks'].sum())),
+        width=1400,
+        title={
+            'text': f"Project Portfolio - {len(rollup)} Projects",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 24, 'color': '#2C3E50'}
+        },
+        template="plotly_white",
+        barmode="overlay",
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Arial, sans-serif", size=12, color="#2C3E50"),
+        margin=dict(l=300, r=200, t=100, b=100),
+        legend=dict(groupclick="togglegroup", bgcolor="white", bordercolor="#333333", borderwidth=1),
+        xaxis=dict(type="date", tickformat="%b %d\n%Y", showgrid=True, gridcolor='#E0E0E0', side="top")
+    )
+    return fig, rollup
+
+
+def rollup_rows(rollup):
+    """Yield the portfolio roll-up rows using the same table markup as the task details."""
+    for row in rollup.itertuples(index=False):
+        yield f'''
+            <tr>
+                <td class="task-name">{row.Project}</td>
+                <td>{row.Tasks}</td>
+                <td>{row.Start.strftime('%B %d, %Y')}</td>
+                <td>{row.End.strftime('%B %d, %Y')}</td>
+                <td>{row.Duration} days</td>{progress_cell(row.Progress)}
+            </tr>'''
+
+
+def _rollup_tables(rollup):
+    return [("Portfolio Roll-up", "Progress is weighted by task duration", ROLLUP_TABLE_COLUMNS, rollup_rows(rollup))]
+
+
+def write_portfolio_report(fig, rollup, path="gantt_portfolio.html", **artifact_options):
+    return write_artifacts(path, fig, _rollup_tables(rollup), title="PROJECT PORTFOLIO",
+                           subtitle=f"{len(rollup)} Projects", page_title="Project Portfolio | Gantt Chart",
+                           **artifact_options)
+
+
+def write_project_reports(results, directory, max_workers=None, **artifact_options):
+    """Write one report per project into `directory` as a batch on write_batch()'s thread pool.
+
+    File names come from the project names; names that clash once sanitized
+    (e.g. "A/B" and "A_B") get a numeric suffix, so no two jobs share a path.
+    Returns the artifact list for each project, in the order of `results`.
+    """
+    os.makedirs(directory, exist_ok=True)
+    jobs, used = [], set()
+    for result in results:
+        fig, rollup = assemble_portfolio([result])
+        name = rollup['Project'].iloc[0]
+        safe_name = stem = "".join(c if c.isalnum() or c in "-_" else "_" for c in str(name))
+        suffix = 1
+        while safe_name.lower() in used:  # lower(): case-insensitive file systems clash too
+            suffix += 1
+            safe_name = f"{stem}_{suffix}"
+        used.add(safe_name.lower())
+        jobs.append((os.path.join(directory, f"{safe_name}.html"), fig, _rollup_tables(rollup), dict(
+            title=str(name).upper(), subtitle=f"{rollup['Tasks'].iloc[0]} Tasks",
+            page_title=f"{name} | Gantt Chart"
+        )))
+    return write_batch(jobs, max_workers, **artifact_options)
+
+
+# ===== COMMAND LINE =====
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a multi-project portfolio Gantt report.")
+    parser.add_argument("projects", nargs="+", help="Project files (.json or .csv)")
+    parser.add_argument("-o", "--output", default="gantt_portfolio.html")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("-c", "--calendars", default=None,
+                        help="JSON file of team calendars: {team: {weekmask, holidays}}; tasks pick one via 'Team'")
+    parser.add_argument("-f", "--formats", nargs="+", default=["html"], choices=sorted(ARTIFACT_SUFFIXES),
+                        help="Artifacts to write: html, gz (.html.gz) and/or br (.html.br)")
+    parser.add_argument("-l", "--level", type=int, default=None, help="Compression level (default: maximum)")
+    parser.add_argument("--minify", action="store_true", help="Minify the embedded CSS")
+    parser.add_argument("--per-project", metavar="DIR", default=None,
+                        help="Also write one report per project into DIR, as a multi-threaded batch")
+    args = parser.parse_args()
+
+    calendars = load_calendars(args.calendars) if args.calendars else None
+    results = build_projects(args.projects, max_workers=args.workers, calendars=calendars)
+    fig, rollup = assemble_portfolio(results)
+    artifact_options = dict(formats=args.formats, level=args.level, minify=args.minify)
+    artifacts = write_portfolio_report(fig, rollup, args.output, **artifact_options)
+    print(f"✓ Portfolio of {len(rollup)} projects saved:")
+    print_artifacts(artifacts)
+
+    if args.per_project:
+        start = time.perf_counter()
+        batch = write_project_reports(results, args.per_project, args.workers, **artifact_options)
+        print(f"✓ {len(batch)} per-project reports saved to '{args.per_project}' "
+              f"in {time.perf_counter() - start:.2f}s:")
+        for project_artifacts in batch:
+            print_artifacts(project_artifacts)